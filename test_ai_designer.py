@@ -1,8 +1,160 @@
 
 import random
 import math
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+import numpy as np
+
+class TemplateType(IntEnum):
+    BENZENE_DERIVATIVE = 0
+    HETEROCYCLE = 1
+    ALIPHATIC_CHAIN = 2
+    PEPTIDE_MIMIC = 3
+    NATURAL_PRODUCT = 4
+
+_PREFIXES = ('Neo', 'Iso', 'Meta', 'Para', 'Ortho', 'Cyclo', 'Tetra', 'Penta')
+_SUFFIXES = ('ine', 'ole', 'ane', 'ide', 'ate', 'yl', 'one', 'al')
+_MECHANISMS = (
+    'Inibição competitiva do sítio ativo',
+    'Modulação alostérica positiva',
+    'Antagonismo de receptor',
+    'Inibição enzimática reversível',
+    'Bloqueio de canal iônico',
+    'Ativação de receptor acoplado à proteína G',
+    'Inibição da síntese proteica',
+    'Modulação da expressão gênica'
+)
+_GROUPS_BY_TYPE = MappingProxyType({
+    'benzene_derivative': ('hydroxyl', 'methyl', 'amino', 'carboxyl'),
+    'heterocycle': ('amino', 'carbonyl', 'hydroxyl', 'methoxy'),
+    'aliphatic_chain': ('hydroxyl', 'amino', 'carboxyl', 'ester'),
+    'peptide_mimic': ('amide', 'amino', 'carboxyl', 'hydroxyl'),
+    'natural_product': ('hydroxyl', 'methyl', 'carbonyl', 'ether')
+})
+_SMILES_VARIATIONS = MappingProxyType({
+    'substituted': 'C1=CC(C)=CC(O)=C1',
+    'fused_rings': 'C1=CC=C2C=CC=CC2=C1',
+    'heteroaromatic': 'C1=CN=CC=C1',
+    'pyridine': 'C1=CC=NC=C1',
+    'pyrimidine': 'C1=CN=CN=C1',
+    'quinoline': 'C1=CC=C2N=CC=CC2=C1',
+    'indole': 'C1=CC=C2C(=C1)C=CN2',
+    'branched': 'CC(C)CC(C)C',
+    'cyclic': 'C1CCCCC1',
+    'unsaturated': 'C=CC=CC=C',
+    'beta_sheet': 'NC(=O)C(N)C(=O)N',
+    'alpha_helix': 'NC(C)C(=O)NC(C)C(=O)N',
+    'steroid': 'C1CC2CCC3C(CCC4CCCCC34)C2CC1',
+    'terpene': 'CC(C)=CCCC(C)=C',
+    'alkaloid': 'CN1CCC2=CC=CC=C2C1',
+    'flavonoid': 'C1=CC(=CC=C1C2=CC(=O)C3=C(C=C(C=C3O2)O)O)O'
+})
+_MAX_GROUPS = 3
+
+# Advantages and concerns come from small fixed universes: bit i of a flag
+# mask selects entry i of the text tuple, and every possible mask is resolved
+# to its final tuple once at import.
+_ADVANTAGE_TEXT = (
+    'Excelente drug-likeness',
+    'Estrutura altamente inovadora',
+    'Baseado em produto natural',
+    'Boa solubilidade aquosa',
+    'Alta seletividade'
+)
+_COMMON_ADVANTAGES = ('Potencial para otimização', 'Síntese viável')
+_TYPE_ADVANTAGE_FLAGS = np.zeros(len(TemplateType), dtype=np.uint8)
+_TYPE_ADVANTAGE_FLAGS[TemplateType.NATURAL_PRODUCT] = 1 << 2
+_TYPE_ADVANTAGE_FLAGS[TemplateType.HETEROCYCLE] = 1 << 3
+_TYPE_ADVANTAGE_FLAGS[TemplateType.PEPTIDE_MIMIC] = 1 << 4
+_CONCERN_TEXT = (
+    'Alta lipofilicidade',
+    'Peso molecular elevado',
+    'TPSA alta - possível baixa permeabilidade',
+    'Baixa lipofilicidade'
+)
+_NO_CONCERNS = ('Necessita validação experimental',)
+
+def _select_by_flags(texts, flags):
+    return tuple(text for bit, text in enumerate(texts) if flags >> bit & 1)
+
+_ADVANTAGES_BY_FLAGS = tuple(
+    _select_by_flags(_ADVANTAGE_TEXT, flags) + _COMMON_ADVANTAGES for flags in range(1 << len(_ADVANTAGE_TEXT))
+)
+_CONCERNS_BY_FLAGS = tuple(
+    _select_by_flags(_CONCERN_TEXT, flags) or _NO_CONCERNS for flags in range(1 << len(_CONCERN_TEXT))
+)
+_ADVANTAGE_POOL_SIZES = np.array([len(advantages) for advantages in _ADVANTAGES_BY_FLAGS])
+_CONCERN_POOL_SIZES = np.array([len(concerns) for concerns in _CONCERNS_BY_FLAGS])
+_MAX_ADVANTAGES = 3
+_MAX_CONCERNS = 2
+
+def _advantage_flags(type_id, drug_likeness, novelty):
+    return (drug_likeness > 0.8) * 1 | (novelty > 0.7) << 1 | _TYPE_ADVANTAGE_FLAGS[type_id]
+
+def _concern_flags(logP, mw, tpsa):
+    return (logP > 5) * 1 | (mw > 500) << 1 | (tpsa > 140) << 2 | (logP < 0) << 3
+
+def _groups_for(type):
+    return _GROUPS_BY_TYPE.get(type, _GROUPS_BY_TYPE['benzene_derivative'])
+
+def _name_base(type):
+    return type.split('_')[0]
+
+def _format_name(prefix, base, suffix, index):
+    return "%s%s%s-%d" % (prefix, base, suffix, index)
+
+def _format_formula(carbon, hydrogen, nitrogen, oxygen):
+    formula = "C%dH%d" % (carbon, hydrogen)
+    if nitrogen > 0: formula += "N%d" % nitrogen
+    if oxygen > 0: formula += "O%d" % oxygen
+    return formula
+
+def _pick_indices(rng, pool_sizes, k):
+    # Row-wise sampling without replacement: argsort of uniform keys is a random
+    # permutation. Keys past a row's pool size are set to +inf so they sort
+    # last, leaving the first min(k, pool size) columns as distinct valid
+    # indices. Ints in, ints out; callers map the indices back to strings.
+    pool_sizes = np.asarray(pool_sizes)
+    keys = rng.random((len(pool_sizes), pool_sizes.max(initial=0)))
+    keys[np.arange(keys.shape[1]) >= pool_sizes[:, None]] = np.inf
+    return np.argsort(keys, axis=1)[:, :k]
+
+class Structure(NamedTuple):
+    rings: int
+    aromaticRings: int
+    heteroatoms: int
+    functionalGroups: tuple
+
+def _generate_properties(rng, n):
+    # Numeric core of a batch: every column is independent per molecule, so one
+    # vectorized call covers the whole batch and only string/object assembly is
+    # left to the Python loop.
+    rings = rng.integers(1, 5, n)
+    return {
+        'molecular_weight': rng.uniform(150, 550, n),
+        'logP': rng.uniform(-2, 6, n),
+        'hbd': rng.integers(0, 6, n),
+        'hba': rng.integers(0, 10, n),
+        'tpsa': rng.uniform(20, 160, n),
+        'synthesis_score': rng.uniform(0.3, 1.0, n),
+        'novelty': rng.uniform(0.4, 1.0, n),
+        'target_affinity': rng.uniform(0.5, 1.0, n),
+        'admet_score': rng.uniform(0.4, 1.0, n),
+        'rings': rings,
+        'aromatic_rings': rng.integers(0, rings),
+        'heteroatoms': rng.integers(0, 8, n)
+    }
 
 class DesignedMolecule:
+    __slots__ = (
+        'id', 'name', 'smiles', 'formula', 'molecularWeight', 'logP', 'hbd', 'hba', 'tpsa',
+        'drugLikeness', 'synthesisScore', 'novelty', 'targetAffinity', 'admetScore',
+        'mechanism', 'advantages', 'concerns', 'structure'
+    )
+
     def __init__(self, id, name, smiles, formula, molecularWeight, logP, hbd, hba, tpsa, drugLikeness, synthesisScore, novelty, targetAffinity, admetScore, mechanism, advantages, concerns, structure):
         self.id = id
         self.name = name
@@ -23,180 +175,249 @@ class DesignedMolecule:
         self.concerns = concerns
         self.structure = structure
 
+def _object_column(values):
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+class MoleculeBatch:
+    # Columnar (SoA) store for a generated batch: one NumPy array per field,
+    # object arrays for strings and tuples. An integer index builds a fresh
+    # DesignedMolecule from the columns, so writes to that object do not
+    # reach the batch; a slice returns a new MoleculeBatch over those rows.
+    _COLUMNS = (
+        'ids', 'names', 'smiles', 'formulas', 'molecular_weight', 'logP', 'hbd', 'hba', 'tpsa',
+        'drug_likeness', 'synthesis_score', 'novelty', 'target_affinity', 'admet_score',
+        'mechanisms', 'advantages', 'concerns', 'rings', 'aromatic_rings', 'heteroatoms',
+        'functional_groups'
+    )
+
+    def __init__(self, **columns):
+        for name in self._COLUMNS:
+            setattr(self, name, columns[name])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return MoleculeBatch(**{name: getattr(self, name)[i] for name in self._COLUMNS})
+        return DesignedMolecule(
+            id=self.ids[i],
+            name=self.names[i],
+            smiles=self.smiles[i],
+            formula=self.formulas[i],
+            molecularWeight=self.molecular_weight[i].item(),
+            logP=self.logP[i].item(),
+            hbd=self.hbd[i].item(),
+            hba=self.hba[i].item(),
+            tpsa=self.tpsa[i].item(),
+            drugLikeness=self.drug_likeness[i].item(),
+            synthesisScore=self.synthesis_score[i].item(),
+            novelty=self.novelty[i].item(),
+            targetAffinity=self.target_affinity[i].item(),
+            admetScore=self.admet_score[i].item(),
+            mechanism=self.mechanisms[i],
+            advantages=self.advantages[i],
+            concerns=self.concerns[i],
+            structure=Structure(
+                rings=self.rings[i].item(),
+                aromaticRings=self.aromatic_rings[i].item(),
+                heteroatoms=self.heteroatoms[i].item(),
+                functionalGroups=self.functional_groups[i]
+            )
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _reindex(self, idx):
+        for name in self._COLUMNS:
+            setattr(self, name, getattr(self, name)[idx])
+
+    def sort_by_drug_likeness(self):
+        # Drug-likeness only takes a handful of distinct values, so ties are the
+        # norm; a stable sort on the negated column keeps tied molecules in
+        # generation order, like sorted(..., reverse=True) does.
+        idx = np.argsort(-self.drug_likeness, kind='stable')
+        self._reindex(idx)
+
 class ImprovedAIMoleculeDesignerSimulator:
-    def __init__(self):
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
         self.molecule_templates = [
             {
                 'type': 'benzene_derivative',
+                'type_id': TemplateType.BENZENE_DERIVATIVE,
                 'baseStructure': 'C1=CC=CC=C1',
                 'variations': ['substituted', 'fused_rings', 'heteroaromatic']
             },
             {
                 'type': 'heterocycle',
+                'type_id': TemplateType.HETEROCYCLE,
                 'baseStructure': 'C1=CN=CC=C1',
                 'variations': ['pyridine', 'pyrimidine', 'quinoline', 'indole']
             },
             {
                 'type': 'aliphatic_chain',
+                'type_id': TemplateType.ALIPHATIC_CHAIN,
                 'baseStructure': 'CCCCCC',
                 'variations': ['branched', 'cyclic', 'unsaturated']
             },
             {
                 'type': 'peptide_mimic',
+                'type_id': TemplateType.PEPTIDE_MIMIC,
                 'baseStructure': 'NC(=O)C',
                 'variations': ['beta_sheet', 'alpha_helix', 'turn_mimic']
             },
             {
                 'type': 'natural_product',
+                'type_id': TemplateType.NATURAL_PRODUCT,
                 'baseStructure': 'C1CC2CCC1C2',
                 'variations': ['steroid', 'terpene', 'alkaloid', 'flavonoid']
             }
         ]
 
+    def _sample(self, items, k):
+        # Partial Fisher-Yates: only the first k slots are shuffled. Cheaper than
+        # Random.sample for the tiny pools (at most 7 items) sampled here.
+        pool = list(items)
+        r = self._rng.random
+        size = len(pool)
+        for i in range(k):
+            j = i + int(r() * (size - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
     def calculate_drug_likeness(self, mw, logP, hbd, hba, tpsa):
-        score = 1.0
-        if mw > 500: score -= 0.2
-        if logP > 5: score -= 0.2
-        if hbd > 5: score -= 0.2
-        if hba > 10: score -= 0.2
-        if tpsa > 140: score -= 0.1
-        return max(0, min(1, score))
+        # Branchless, so it applies elementwise to whole columns as well as to
+        # scalars. The penalties add up to at most 0.9, so the score always
+        # stays within [0.1, 1] and needs no clamping.
+        return 1.0 - 0.2 * (mw > 500) - 0.2 * (logP > 5) - 0.2 * (hbd > 5) - 0.2 * (hba > 10) - 0.1 * (tpsa > 140)
 
     def generate_functional_groups(self, type, variation):
-        groups = {
-            'benzene_derivative': ['hydroxyl', 'methyl', 'amino', 'carboxyl'],
-            'heterocycle': ['amino', 'carbonyl', 'hydroxyl', 'methoxy'],
-            'aliphatic_chain': ['hydroxyl', 'amino', 'carboxyl', 'ester'],
-            'peptide_mimic': ['amide', 'amino', 'carboxyl', 'hydroxyl'],
-            'natural_product': ['hydroxyl', 'methyl', 'carbonyl', 'ether']
-        }
-        available_groups = groups.get(type, groups['benzene_derivative'])
-        count = 1 + math.floor(random.random() * 3)
-        return random.sample(available_groups, min(count, len(available_groups)))
+        available_groups = _groups_for(type)
+        count = 1 + math.floor(self._rng.random() * _MAX_GROUPS)
+        return tuple(self._sample(available_groups, min(count, len(available_groups))))
 
     def generate_molecule_name(self, type, variation, index):
-        prefixes = ['Neo', 'Iso', 'Meta', 'Para', 'Ortho', 'Cyclo', 'Tetra', 'Penta']
-        suffixes = ['ine', 'ole', 'ane', 'ide', 'ate', 'yl', 'one', 'al']
-        prefix = random.choice(prefixes)
-        suffix = random.choice(suffixes)
-        base = type.split('_')[0]
-        return f"{prefix}{base}{suffix}-{index}"
+        prefix = self._rng.choice(_PREFIXES)
+        suffix = self._rng.choice(_SUFFIXES)
+        return _format_name(prefix, _name_base(type), suffix, index)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _smiles_for(variation, base):
+        return _SMILES_VARIATIONS.get(variation, base)
 
     def generate_smiles(self, template, variation):
-        variations = {
-            'substituted': 'C1=CC(C)=CC(O)=C1',
-            'fused_rings': 'C1=CC=C2C=CC=CC2=C1',
-            'heteroaromatic': 'C1=CN=CC=C1',
-            'pyridine': 'C1=CC=NC=C1',
-            'pyrimidine': 'C1=CN=CN=C1',
-            'quinoline': 'C1=CC=C2N=CC=CC2=C1',
-            'indole': 'C1=CC=C2C(=C1)C=CN2',
-            'branched': 'CC(C)CC(C)C',
-            'cyclic': 'C1CCCCC1',
-            'unsaturated': 'C=CC=CC=C',
-            'beta_sheet': 'NC(=O)C(N)C(=O)N',
-            'alpha_helix': 'NC(C)C(=O)NC(C)C(=O)N',
-            'steroid': 'C1CC2CCC3C(CCC4CCCCC34)C2CC1',
-            'terpene': 'CC(C)=CCCC(C)=C',
-            'alkaloid': 'CN1CCC2=CC=CC=C2C1',
-            'flavonoid': 'C1=CC(=CC=C1C2=CC(=O)C3=C(C=C(C=C3O2)O)O)O'
-        }
-        return variations.get(variation, template['baseStructure'])
+        return self._smiles_for(variation, template['baseStructure'])
 
     def generate_formula(self, mw):
         carbon_count = math.floor(mw / 20)
         hydrogen_count = math.floor(carbon_count * 1.5)
-        oxygen_count = math.floor(random.random() * 4)
-        nitrogen_count = math.floor(random.random() * 3)
-        formula = f"C{carbon_count}H{hydrogen_count}"
-        if nitrogen_count > 0: formula += f"N{nitrogen_count}"
-        if oxygen_count > 0: formula += f"O{oxygen_count}"
-        return formula
+        oxygen_count = math.floor(self._rng.random() * 4)
+        nitrogen_count = math.floor(self._rng.random() * 3)
+        return _format_formula(carbon_count, hydrogen_count, nitrogen_count, oxygen_count)
 
     def generate_mechanism(self, protein, mechanism):
         if mechanism: return mechanism
-        mechanisms = [
-            'Inibição competitiva do sítio ativo',
-            'Modulação alostérica positiva',
-            'Antagonismo de receptor',
-            'Inibição enzimática reversível',
-            'Bloqueio de canal iônico',
-            'Ativação de receptor acoplado à proteína G',
-            'Inibição da síntese proteica',
-            'Modulação da expressão gênica'
-        ]
-        return random.choice(mechanisms)
-
-    def generate_advantages(self, type, drug_likeness, novelty):
-        advantages = []
-        if drug_likeness > 0.8: advantages.append('Excelente drug-likeness')
-        if novelty > 0.7: advantages.append('Estrutura altamente inovadora')
-        if type == 'natural_product': advantages.append('Baseado em produto natural')
-        if type == 'heterocycle': advantages.append('Boa solubilidade aquosa')
-        if type == 'peptide_mimic': advantages.append('Alta seletividade')
-        advantages.append('Potencial para otimização')
-        advantages.append('Síntese viável')
-        return random.sample(advantages, min(3, len(advantages)))
+        return self._rng.choice(_MECHANISMS)
+
+    def generate_advantages(self, type_id, drug_likeness, novelty):
+        advantages = _ADVANTAGES_BY_FLAGS[_advantage_flags(type_id, drug_likeness, novelty)]
+        return tuple(self._sample(advantages, min(_MAX_ADVANTAGES, len(advantages))))
 
     def generate_concerns(self, logP, mw, tpsa):
-        concerns = []
-        if logP > 5: concerns.append('Alta lipofilicidade')
-        if mw > 500: concerns.append('Peso molecular elevado')
-        if tpsa > 140: concerns.append('TPSA alta - possível baixa permeabilidade')
-        if logP < 0: concerns.append('Baixa lipofilicidade')
-        if not concerns: concerns.append('Necessita validação experimental')
-        return random.sample(concerns, min(2, len(concerns)))
+        concerns = _CONCERNS_BY_FLAGS[_concern_flags(logP, mw, tpsa)]
+        return tuple(self._sample(concerns, min(_MAX_CONCERNS, len(concerns))))
 
     def generate_diverse_molecules(self, molecule_count=5):
-        molecules = []
-        for i in range(molecule_count):
-            template = random.choice(self.molecule_templates)
-            variation = random.choice(template['variations'])
-
-            molecular_weight = 150 + random.random() * 400
-            logP = -2 + random.random() * 8
-            hbd = math.floor(random.random() * 6)
-            hba = math.floor(random.random() * 10)
-            tpsa = 20 + random.random() * 140
-
-            drug_likeness = self.calculate_drug_likeness(molecular_weight, logP, hbd, hba, tpsa)
-            synthesis_score = 0.3 + random.random() * 0.7
-            novelty = 0.4 + random.random() * 0.6
-            target_affinity = 0.5 + random.random() * 0.5
-            admet_score = 0.4 + random.random() * 0.6
-
-            rings = math.floor(1 + random.random() * 4)
-            aromatic_rings = math.floor(random.random() * rings)
-            heteroatoms = math.floor(random.random() * 8)
-            functional_groups = self.generate_functional_groups(template['type'], variation)
-
-            molecule = DesignedMolecule(
-                id=f"ai_mol_{i + 1}_{random.randint(1000, 9999)}",
-                name=self.generate_molecule_name(template['type'], variation, i + 1),
-                smiles=self.generate_smiles(template, variation),
-                formula=self.generate_formula(molecular_weight),
-                molecularWeight=round(molecular_weight * 100) / 100,
-                logP=round(logP * 100) / 100,
-                hbd=hbd,
-                hba=hba,
-                tpsa=round(tpsa * 100) / 100,
-                drugLikeness=drug_likeness,
-                synthesisScore=synthesis_score,
-                novelty=novelty,
-                targetAffinity=target_affinity,
-                admetScore=admet_score,
-                mechanism=self.generate_mechanism(None, None),
-                advantages=self.generate_advantages(template['type'], drug_likeness, novelty),
-                concerns=self.generate_concerns(logP, molecular_weight, tpsa),
-                structure={
-                    'rings': rings,
-                    'aromaticRings': aromatic_rings,
-                    'heteroatoms': heteroatoms,
-                    'functionalGroups': functional_groups
-                }
-            )
-            molecules.append(molecule)
-        return sorted(molecules, key=lambda x: x.drugLikeness, reverse=True)
+        n = molecule_count
+        rng = self._np_rng
+        smiles_for = self._smiles_for
+        props = _generate_properties(rng, n)
+        molecular_weight, logP, tpsa = props['molecular_weight'], props['logP'], props['tpsa']
+        hbd, hba, novelty = props['hbd'], props['hba'], props['novelty']
+        drug_likeness = self.calculate_drug_likeness(molecular_weight, logP, hbd, hba, tpsa)
+
+        templates = self.molecule_templates
+        template_column = rng.integers(0, len(templates), n)
+        template_idx = template_column.tolist()
+        n_variations = np.array([len(template['variations']) for template in templates])
+        variation_idx = rng.integers(0, n_variations[template_column]).tolist()
+        type_id_column = np.array([template['type_id'] for template in templates], dtype=int)[template_column]
+        name_bases = [_name_base(template['type']) for template in templates]
+        prefix_idx = rng.integers(0, len(_PREFIXES), n).tolist()
+        suffix_idx = rng.integers(0, len(_SUFFIXES), n).tolist()
+        mechanism_idx = rng.integers(0, len(_MECHANISMS), n)
+        template_groups = [_groups_for(template['type']) for template in templates]
+        pool_sizes = np.array([len(groups) for groups in template_groups])[template_column]
+        group_count = np.minimum(rng.integers(1, _MAX_GROUPS + 1, n), pool_sizes).tolist()
+        group_idx = _pick_indices(rng, pool_sizes, _MAX_GROUPS).tolist()
+
+        carbon = (molecular_weight / 20).astype(int)
+        hydrogen = (carbon * 1.5).astype(int)
+        oxygen = rng.integers(0, 4, n)
+        nitrogen = rng.integers(0, 3, n)
+        formulas = list(map(_format_formula, carbon.tolist(), hydrogen.tolist(), nitrogen.tolist(), oxygen.tolist()))
+
+        id_suffixes = rng.integers(1000, 10000, n).tolist()
+        ids = ["ai_mol_%d_%d" % pair for pair in enumerate(id_suffixes, 1)]
+
+        names, smiles = [], []
+        advantages, concerns, functional_groups = [], [], []
+        advantage_flag_column = _advantage_flags(type_id_column, drug_likeness, novelty)
+        advantage_sizes = _ADVANTAGE_POOL_SIZES[advantage_flag_column]
+        advantage_count = np.minimum(_MAX_ADVANTAGES, advantage_sizes).tolist()
+        advantage_idx = _pick_indices(rng, advantage_sizes, _MAX_ADVANTAGES).tolist()
+        advantage_flags = advantage_flag_column.tolist()
+        concern_flag_column = _concern_flags(logP, molecular_weight, tpsa)
+        concern_sizes = _CONCERN_POOL_SIZES[concern_flag_column]
+        concern_count = np.minimum(_MAX_CONCERNS, concern_sizes).tolist()
+        concern_idx = _pick_indices(rng, concern_sizes, _MAX_CONCERNS).tolist()
+        concern_flags = concern_flag_column.tolist()
+        for i in range(n):
+            template = templates[template_idx[i]]
+            variation = template['variations'][variation_idx[i]]
+            available_groups = template_groups[template_idx[i]]
+
+            names.append(_format_name(_PREFIXES[prefix_idx[i]], name_bases[template_idx[i]], _SUFFIXES[suffix_idx[i]], i + 1))
+            smiles.append(smiles_for(variation, template['baseStructure']))
+            molecule_advantages = _ADVANTAGES_BY_FLAGS[advantage_flags[i]]
+            advantages.append(tuple(molecule_advantages[j] for j in advantage_idx[i][:advantage_count[i]]))
+            molecule_concerns = _CONCERNS_BY_FLAGS[concern_flags[i]]
+            concerns.append(tuple(molecule_concerns[j] for j in concern_idx[i][:concern_count[i]]))
+            functional_groups.append(tuple(available_groups[j] for j in group_idx[i][:group_count[i]]))
+
+        batch = MoleculeBatch(
+            ids=_object_column(ids),
+            names=_object_column(names),
+            smiles=_object_column(smiles),
+            formulas=_object_column(formulas),
+            molecular_weight=np.round(molecular_weight, 2),
+            logP=np.round(logP, 2),
+            hbd=hbd,
+            hba=hba,
+            tpsa=np.round(tpsa, 2),
+            drug_likeness=drug_likeness,
+            synthesis_score=props['synthesis_score'],
+            novelty=novelty,
+            target_affinity=props['target_affinity'],
+            admet_score=props['admet_score'],
+            mechanisms=_object_column(_MECHANISMS)[mechanism_idx],
+            advantages=_object_column(advantages),
+            concerns=_object_column(concerns),
+            rings=props['rings'],
+            aromatic_rings=props['aromatic_rings'],
+            heteroatoms=props['heteroatoms'],
+            functional_groups=_object_column(functional_groups)
+        )
+        batch.sort_by_drug_likeness()
+        return batch
 
 if __name__ == '__main__':
     simulator = ImprovedAIMoleculeDesignerSimulator()
@@ -211,20 +432,20 @@ if __name__ == '__main__':
         print(f"Mecanismo: {mol.mechanism}")
         print(f"Vantagens: {', '.join(mol.advantages)}")
         print(f"Preocupações: {', '.join(mol.concerns)}")
-        print(f"Estrutura: Anéis={mol.structure['rings']}, Aromáticos={mol.structure['aromaticRings']}, Heteroátomos={mol.structure['heteroatoms']}, Grupos Funcionais={', '.join(mol.structure['functionalGroups'])}")
+        print(f"Estrutura: Anéis={mol.structure.rings}, Aromáticos={mol.structure.aromaticRings}, Heteroátomos={mol.structure.heteroatoms}, Grupos Funcionais={', '.join(mol.structure.functionalGroups)}")
         print("------------------------")
 
     # Verificar diversidade
-    smiles_set = set(mol.smiles for mol in generated_molecules)
-    print(f"\nNúmero de SMILES únicos: {len(smiles_set)}")
-    if len(smiles_set) == len(generated_molecules):
+    unique_smiles = np.unique(generated_molecules.smiles).size
+    print(f"\nNúmero de SMILES únicos: {unique_smiles}")
+    if unique_smiles == len(generated_molecules):
         print("✅ As moléculas geradas possuem SMILES únicos, indicando diversidade estrutural.")
     else:
         print("❌ Algumas moléculas geradas possuem SMILES duplicados.")
 
-    names_set = set(mol.name for mol in generated_molecules)
-    print(f"Número de Nomes únicos: {len(names_set)}")
-    if len(names_set) == len(generated_molecules):
+    unique_names = np.unique(generated_molecules.names).size
+    print(f"Número de Nomes únicos: {unique_names}")
+    if unique_names == len(generated_molecules):
         print("✅ As moléculas geradas possuem nomes únicos.")
     else:
         print("❌ Algumas moléculas geradas possuem nomes duplicados.")